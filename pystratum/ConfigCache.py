@@ -0,0 +1,47 @@
+"""
+PyStratum
+"""
+import functools
+import os
+from typing import Mapping
+
+from pystratum.ConfigMapping import ConfigMapping
+from pystratum.FastConfigParser import FastConfigParser
+
+
+class ConfigCache:
+    """
+    Cache for parsed configuration files. A configuration file is parsed only once per modification time.
+    """
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def get(config_filename: str) -> Mapping[str, Mapping[str, str]]:
+        """
+        Returns a read only map from section names to a map from option names to option values of a configuration
+        file. A missing section or option raises a configparser.NoSectionError or configparser.NoOptionError.
+
+        :param str config_filename: The name of the configuration file.
+
+        :rtype: Mapping[str,Mapping[str,str]]
+        """
+        return ConfigCache.__load(config_filename, os.stat(config_filename).st_mtime_ns)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def __load(config_filename: str, m_time: int) -> Mapping[str, Mapping[str, str]]:
+        """
+        Parses a configuration file.
+
+        :param str config_filename: The name of the configuration file.
+        :param int m_time: The modification time of the configuration file in nanoseconds. Only used as part of the
+                           key of the cache.
+
+        :rtype: Mapping[str,Mapping[str,str]]
+        """
+        config = FastConfigParser.load(config_filename)
+
+        return ConfigMapping({section: ConfigMapping(options, section) for section, options in config.items()})
+
+# ----------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,93 @@
+"""
+PyStratum
+"""
+import configparser
+from typing import Any, Iterator, Mapping, Optional
+
+
+class ConfigMapping(Mapping):
+    """
+    A read only view on the sections of a configuration file or on the options of one section. Like configparser,
+    raises a NoSectionError or NoOptionError when a section or option is missing.
+    """
+    __slots__ = ('__mapping', '__section')
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __init__(self, mapping: Mapping[str, Any], section: Optional[str] = None):
+        """
+        Object constructor.
+
+        :param Mapping mapping: The map from section names to sections or the map from option names to option values.
+        :param str|None section: The name of the section if mapping holds options, None if mapping holds sections.
+        """
+        self.__mapping: Mapping[str, Any] = mapping
+        """
+        The map from section names to sections or the map from option names to option values.
+        """
+
+        self.__section: Optional[str] = section
+        """
+        The name of the section if this mapping holds options, None if this mapping holds sections.
+        """
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __getitem__(self, key: str) -> Any:
+        """
+        Returns a section or an option value.
+
+        :param str key: The name of the section or option.
+
+        :rtype: *
+        """
+        try:
+            return self.__mapping[key]
+        except KeyError:
+            if self.__section is None:
+                raise configparser.NoSectionError(key) from None
+            raise configparser.NoOptionError(key, self.__section) from None
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __contains__(self, key: object) -> bool:
+        """
+        Returns True if a section or option exists. Otherwise returns False.
+
+        :param str key: The name of the section or option.
+
+        :rtype: bool
+        """
+        return key in self.__mapping
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Returns a section or an option value if it exists. Otherwise returns a default value.
+
+        :param str key: The name of the section or option.
+        :param * default: The default value.
+
+        :rtype: *
+        """
+        if key in self.__mapping:
+            return self.__mapping[key]
+
+        return default
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __iter__(self) -> Iterator[str]:
+        """
+        Returns an iterator over the names of the sections or options.
+
+        :rtype: Iterator[str]
+        """
+        return iter(self.__mapping)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __len__(self) -> int:
+        """
+        Returns the number of sections or options.
+
+        :rtype: int
+        """
+        return len(self.__mapping)
+
+# ----------------------------------------------------------------------------------------------------------------------
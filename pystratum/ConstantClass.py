@@ -8,6 +8,16 @@ from typing import Dict, Any, List, Union
 
 from pystratum.style.PyStratumStyle import PyStratumStyle
 
+_CONSTANT_NAME_RE = re.compile(r'^[A-Z][A-Z0-9_]*$')
+"""
+Regular expression for the name of a constant.
+"""
+
+_INDENT_RE = re.compile(r'^(\s+)')
+"""
+Regular expression for the indent of a line.
+"""
+
 
 class ConstantClass:
     """
@@ -98,7 +108,7 @@ class ConstantClass:
         name = self.__class_name.split('.')[-1]
         constant_class = getattr(self.__module, name)
         for name, value in constant_class.__dict__.items():
-            if re.match(r'^[A-Z][A-Z0-9_]*$', name):
+            if _CONSTANT_NAME_RE.match(name):
                 ret[name] = value
 
         return ret
@@ -127,7 +137,7 @@ class ConstantClass:
                 if line.strip() == self.__annotation:
                     ret['start_line'] = count + 1
                     ret['last_line'] = count + 1
-                    parts = re.match(r'^(\s+)', line)
+                    parts = _INDENT_RE.match(line)
                     ret['indent'] = parts.group(1)
                     mode = 2
 
@@ -154,6 +164,30 @@ class ConstantClass:
 
         :param dict[str,int] constants: The new constants.
 
+        :rtype: str
+        """
+        return self.source_with_constants_rendered(ConstantClass.render_constants(constants))
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def render_constants(constants: Dict[str, int]) -> str:
+        """
+        Returns the (not indented) constant declaration statements of constants sorted by name.
+
+        :param dict[str,int] constants: The constants.
+
+        :rtype: str
+        """
+        return "\n".join(['{0} = {1}'.format(constant, value) for constant, value in sorted(constants.items())])
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def source_with_constants_rendered(self, rendered: str) -> str:
+        """
+        Returns the source of the module with the class that acts like a namespace for constants with new constants.
+
+        :param str rendered: The (not indented) constant declaration statements of the new constants as returned by
+                             render_constants.
+
         :rtype: str
         """
         old_lines = self.source().split("\n")
@@ -161,8 +195,9 @@ class ConstantClass:
 
         new_lines = old_lines[0:info['start_line']]
 
-        for constant, value in sorted(constants.items()):
-            new_lines.append("{0}{1} = {2}".format(info['indent'], str(constant), str(value)))
+        if rendered:
+            indent = info['indent']
+            new_lines.append(indent + rendered.replace("\n", "\n" + indent))
 
         new_lines.extend(old_lines[info['last_line']:])
 
@@ -2,12 +2,12 @@
 PyStratum
 """
 import abc
-import configparser
 from typing import Dict, Optional
 
 from pystratum.style.PyStratumStyle import PyStratumStyle
 
 from pystratum.ConstantClass import ConstantClass
+from pystratum.ConfigCache import ConfigCache
 from pystratum.Util import Util
 
 
@@ -124,12 +124,11 @@ class Constants:
 
         :param str config_filename: The name of the configuration file.
         """
-        config = configparser.ConfigParser()
-        config.read(config_filename)
+        config = ConfigCache.get(config_filename)
 
-        self._constants_filename = config.get('constants', 'columns')
-        self._prefix = config.get('constants', 'prefix')
-        self._class_name = config.get('constants', 'class')
+        self._constants_filename = config['constants']['columns']
+        self._prefix = config['constants']['prefix']
+        self._class_name = config['constants']['class']
 
     # ------------------------------------------------------------------------------------------------------------------
     @abc.abstractmethod
@@ -199,7 +198,7 @@ class Constants:
         """
         helper = ConstantClass(self._class_name, self._io)
 
-        content = helper.source_with_constants(self._constants)
+        content = helper.source_with_constants_rendered(ConstantClass.render_constants(self._constants))
 
         Util.write_two_phases(helper.file_name(), content, self._io)
 
@@ -0,0 +1,108 @@
+"""
+PyStratum
+"""
+import configparser
+import re
+from typing import Dict, Mapping
+
+_SECTION_RE = re.compile(r'^\[(?P<section>[^\]]+)\]\s*$')
+"""
+Regular expression for a section header.
+"""
+
+_OPTION_RE = re.compile(r'^(?P<key>[^=:\s][^=:]*)\s*[:=]\s*(?P<val>.*)$')
+"""
+Regular expression for an option.
+"""
+
+
+class FastConfigParser:
+    """
+    A lightweight parser for simple INI files, i.e. files with sections and single line key=value (or key: value)
+    options only.
+    """
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def load(config_filename: str) -> Dict[str, Mapping[str, str]]:
+        """
+        Reads a configuration file and returns a map from section names to a map from option names to option values.
+
+        Files using features beyond simple key=value options (e.g. multiline values, interpolation, or a DEFAULT
+        section) are parsed with configparser instead.
+
+        :param str config_filename: The name of the configuration file.
+
+        :rtype: dict[str,Mapping[str,str]]
+        """
+        with open(config_filename, 'r') as file:
+            text = file.read()
+
+        try:
+            return FastConfigParser.parse(text)
+        except ValueError:
+            return FastConfigParser.__load_with_config_parser(config_filename)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def parse(text: str) -> Dict[str, Dict[str, str]]:
+        """
+        Parses the content of a simple INI file. Raises a ValueError if the content is not a simple INI file.
+
+        :param str text: The content of the INI file.
+
+        :rtype: dict[str,dict[str,str]]
+        """
+        config = {}
+        options = None
+        for line in text.splitlines():
+            stripped = line.strip()
+            if not stripped or stripped[0] in '#;':
+                continue
+
+            if line[0].isspace():
+                raise ValueError('Continuation lines are not supported')
+
+            match = _SECTION_RE.match(stripped)
+            if match:
+                section = match.group('section')
+                if section in config or section == configparser.DEFAULTSECT:
+                    raise ValueError('Duplicate or default section')
+
+                options = config[section] = {}
+                continue
+
+            match = _OPTION_RE.match(stripped)
+            if match:
+                if options is None:
+                    raise ValueError('Option outside section')
+
+                key = match.group('key').rstrip().lower()
+                value = match.group('val').strip()
+                if key in options or '%' in value:
+                    raise ValueError('Duplicate option or interpolation')
+
+                options[key] = value
+                continue
+
+            raise ValueError('Unable to parse line')
+
+        return config
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def __load_with_config_parser(config_filename: str) -> Dict[str, Mapping[str, str]]:
+        """
+        Reads a configuration file with configparser. The sections are returned as configparser section proxies such
+        that values are interpolated only when read.
+
+        :param str config_filename: The name of the configuration file.
+
+        :rtype: dict[str,configparser.SectionProxy]
+        """
+        config = configparser.ConfigParser()
+        config.read(config_filename)
+
+        return {section: config[section] for section in config.sections()}
+
+# ----------------------------------------------------------------------------------------------------------------------
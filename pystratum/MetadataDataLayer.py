@@ -4,6 +4,8 @@ PyStratum
 import os
 from typing import Optional
 
+from cleo import Output
+
 from pystratum.style.PyStratumStyle import PyStratumStyle
 
 
@@ -24,6 +26,9 @@ class MetadataDataLayer:
 
         :param str query: The query.
         """
+        if MetadataDataLayer.io.get_verbosity() < Output.VERBOSITY_VERY_VERBOSE:
+            return
+
         query = query.strip()
 
         if os.linesep in query:
@@ -2,17 +2,25 @@
 PyStratum
 """
 import abc
-import configparser
 import json
 import os
+import types
 from typing import Dict, Optional, List
 
+from pystratum.ConfigCache import ConfigCache
 from pystratum.RoutineLoaderHelper import RoutineLoaderHelper
 
 from pystratum.style.PyStratumStyle import PyStratumStyle
 
 from pystratum.ConstantClass import ConstantClass
 
+_REPLACE_PAIR_FORMATTERS = types.MappingProxyType({int:   str,
+                                                   float: str,
+                                                   bool:  lambda value: '1' if value else '0'})
+"""
+Map from the types of constant values to the functions for converting a constant value to a replace pair value.
+"""
+
 
 class RoutineLoader:
     """
@@ -50,7 +58,7 @@ class RoutineLoader:
 
         self._replace_pairs: Dict = {}
         """
-        A map from placeholders to their actual values.
+        A map from placeholders to their actual values. The placeholders must be in lower case.
         """
 
         self._source_file_encoding: Optional[str] = None
@@ -147,17 +155,16 @@ class RoutineLoader:
         key = '@' + name + '@'
         key = key.lower()
 
-        class_name = value.__class__.__name__
+        value_type = value.__class__
+        formatter = _REPLACE_PAIR_FORMATTERS.get(value_type)
 
-        if class_name in ['int', 'float']:
-            value = str(value)
-        elif class_name in ['bool']:
-            value = '1' if value else '0'
-        elif class_name in ['str']:
+        if formatter is not None:
+            value = formatter(value)
+        elif value_type is str:
             if quote:
                 value = "'" + value + "'"
         else:
-            self._io.log_verbose("Ignoring constant {} which is an instance of {}".format(name, class_name))
+            self._io.log_verbose("Ignoring constant {} which is an instance of {}".format(name, value_type.__name__))
 
         self._replace_pairs[key] = value
 
@@ -209,17 +216,16 @@ class RoutineLoader:
 
         :param str config_filename: The name of the configuration file.
         """
-        config = configparser.ConfigParser()
-        config.read(config_filename)
+        config = ConfigCache.get(config_filename)
 
-        self._source_directory = config.get('loader', 'source_directory')
-        self._source_file_extension = config.get('loader', 'extension')
-        self._source_file_encoding = config.get('loader', 'encoding')
-        self.__shadow_directory = config.get('loader', 'shadow_directory', fallback=None)
+        self._source_directory = config['loader']['source_directory']
+        self._source_file_extension = config['loader']['extension']
+        self._source_file_encoding = config['loader']['encoding']
+        self.__shadow_directory = config['loader'].get('shadow_directory')
 
-        self._pystratum_metadata_filename = config.get('wrapper', 'metadata')
+        self._pystratum_metadata_filename = config['wrapper']['metadata']
 
-        self._constants_class_name = config.get('constants', 'class')
+        self._constants_class_name = config['constants']['class']
 
     # ------------------------------------------------------------------------------------------------------------------
     def __find_source_files(self) -> None:
@@ -280,6 +286,7 @@ class RoutineLoader:
         """
         self._io.writeln('')
 
+        helpers = []
         for routine_name in sorted(self._source_file_names):
             if routine_name in self._pystratum_metadata:
                 old_metadata = self._pystratum_metadata[routine_name]
@@ -293,8 +300,17 @@ class RoutineLoader:
 
             routine_loader_helper = self.create_routine_loader_helper(routine_name, old_metadata, old_routine_info)
             routine_loader_helper.shadow_directory = self.__shadow_directory
+            helpers.append((routine_name, routine_loader_helper))
+
+        helpers_to_load = []
+        for _, routine_loader_helper in helpers:
+            if routine_loader_helper.plan():
+                helpers_to_load.append(routine_loader_helper)
+
+        RoutineLoaderHelper.prefetch_sources(helpers_to_load)
 
-            metadata = routine_loader_helper.load_stored_routine()
+        for routine_name, routine_loader_helper in helpers:
+            metadata = routine_loader_helper.execute()
 
             if not metadata:
                 self.error_file_names.add(self._source_file_names[routine_name])
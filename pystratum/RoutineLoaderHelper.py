@@ -2,10 +2,14 @@
 PyStratum
 """
 import abc
+import bisect
+import codecs
+import concurrent.futures
 import math
 import os
 import re
 import stat
+import sys
 from typing import Dict, Optional, List, Union, Tuple
 
 from pystratum.helper.DataTypeHelper import DataTypeHelper
@@ -14,11 +18,71 @@ from pystratum.style.PyStratumStyle import PyStratumStyle
 from pystratum.DocBlockReflection import DocBlockReflection
 from pystratum.exception.LoaderException import LoaderException
 
+_PLACEHOLDER_RE = re.compile(r'(@[A-Za-z0-9_.]+(?:%(?:max-)?type)?@)')
+"""
+Regular expression for placeholders in the source of a stored routine.
+"""
+
+_PLACEHOLDER_RE_B = re.compile(rb'(@[A-Za-z0-9_.]+(?:%(?:max-)?type)?@)')
+"""
+Regular expression for placeholders in the raw (i.e. undecoded) source of a stored routine.
+"""
+
+_ASCII_COMPATIBLE_ENCODINGS = frozenset(['ascii', 'cp1252', 'iso8859-1', 'iso8859-15', 'utf-8', 'utf-8-sig'])
+"""
+Encodings in which ASCII characters are encoded as single bytes that never occur in the encoding of other characters.
+For these encodings placeholders can be found in the raw source.
+"""
+
+_DESIGNATION_RE = re.compile(r'^\s*--\s+type\s*:\s*(\w+)\s*(.+)?\s*', re.IGNORECASE)
+"""
+Regular expression for the designation type annotation of a stored routine.
+"""
+
+_BULK_INSERT_RE = re.compile(r'([a-zA-Z0-9_]+)\s+([a-zA-Z0-9_,]+)', re.IGNORECASE)
+"""
+Regular expression for the table name and columns of the bulk_insert designation type.
+"""
+
+_DOC_BLOCK_START_RE = re.compile(r'\s*/\*\*')
+"""
+Regular expression for the first line of a DocBlock.
+"""
+
+_DOC_BLOCK_END_RE = re.compile(r'\s*\*/')
+"""
+Regular expression for the last line of a DocBlock.
+"""
+
+_PARAM_TAG_RE = re.compile(r'^(@param)\s+(\w+)\s*(.+)?', re.DOTALL)
+"""
+Regular expression for a @param tag in a DocBlock.
+"""
+
+_NEWLINE_RE = re.compile(r'\n')
+"""
+Regular expression for line endings in the source of a stored routine.
+"""
+
+_MAGIC_CONSTANTS = ('__FILE__', '__ROUTINE__', '__DIR__', '__LINE__')
+"""
+The names of the magic constants.
+"""
+
 
 class RoutineLoaderHelper(metaclass=abc.ABCMeta):
     """
     Class for loading a single stored routine into a RDBMS instance from a (pseudo) SQL file.
     """
+    __slots__ = ('__load', '__real_path', '__routine_source_code_bytes', '__routine_source_code_lines', '__source_stat',
+                 '_columns', '_columns_types', '_designation_type', '_doc_block_parts_source',
+                 '_doc_block_parts_wrapper', '_fields', '_io', '_m_time', '_parameters', '_pystratum_metadata',
+                 '_pystratum_old_metadata', '_rdbms_old_metadata', '_replace', '_replace_pairs',
+                 '_routine_file_encoding', '_routine_name', '_routine_source_code', '_routine_type',
+                 '_source_filename', '_table_name', 'shadow_directory')
+    """
+    The attributes of a routine loader helper. Subclasses that add attributes should declare their own __slots__.
+    """
 
     # ------------------------------------------------------------------------------------------------------------------
     def __init__(self,
@@ -34,7 +98,7 @@ class RoutineLoaderHelper(metaclass=abc.ABCMeta):
         :param str routine_filename: The filename of the source of the stored routine.
         :param str routine_file_encoding: The encoding of the source file.
         :param dict pystratum_old_metadata: The metadata of the stored routine from PyStratum.
-        :param dict[str,str] replace_pairs: A map from placeholders to their actual values.
+        :param dict[str,str] replace_pairs: A map from placeholders (in lower case) to their actual values.
         :param dict rdbms_old_metadata: The old metadata of the stored routine from MS SQL Server.
         :param PyStratumStyle io: The output decorator.
         """
@@ -43,6 +107,11 @@ class RoutineLoaderHelper(metaclass=abc.ABCMeta):
         The source filename holding the stored routine.
         """
 
+        self.__real_path: Optional[str] = None
+        """
+        The canonical path of the source file. Resolved on first use.
+        """
+
         self._routine_file_encoding: str = routine_file_encoding
         """
         The encoding of the routine file.
@@ -61,7 +130,7 @@ class RoutineLoaderHelper(metaclass=abc.ABCMeta):
 
         self._replace_pairs: Dict[str, str] = replace_pairs
         """
-        A map from placeholders to their actual values.
+        A map from placeholders to their actual values. The placeholders are in lower case.
         """
 
         self._rdbms_old_metadata: Dict = rdbms_old_metadata
@@ -74,6 +143,16 @@ class RoutineLoaderHelper(metaclass=abc.ABCMeta):
         The last modification time of the source file.
         """
 
+        self.__source_stat: Optional[os.stat_result] = None
+        """
+        The status of the source file.
+        """
+
+        self.__load: Optional[bool] = None
+        """
+        Whether the stored routine must be (re)loaded as determined by plan. None if not determined (yet).
+        """
+
         self._routine_name: Optional[str] = None
         """
         The name of the stored routine.
@@ -84,9 +163,15 @@ class RoutineLoaderHelper(metaclass=abc.ABCMeta):
         The source code as a single string of the stored routine.
         """
 
-        self._routine_source_code_lines: List[str] = []
+        self.__routine_source_code_lines: Optional[List[str]] = None
         """
-        The source code as an array of lines string of the stored routine.
+        The source code as an array of lines string of the stored routine. Computed on first use.
+        """
+
+        self.__routine_source_code_bytes: Optional[bytes] = None
+        """
+        The raw source code of the stored routine, if its encoding is ASCII compatible, until the placeholders have been
+        extracted.
         """
 
         self._replace: Dict = {}
@@ -149,6 +234,31 @@ class RoutineLoaderHelper(metaclass=abc.ABCMeta):
         The name of the directory were copies with pure SQL of the stored routine sources must be stored.
         """
 
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def _routine_source_code_lines(self) -> List[str]:
+        """
+        The source code as an array of lines string of the stored routine as read from the source file.
+
+        :rtype: list[str]
+        """
+        if self.__routine_source_code_lines is None:
+            if self._routine_source_code is None:
+                return []
+            self.__routine_source_code_lines = self._routine_source_code.split("\n")
+
+        return self.__routine_source_code_lines
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @_routine_source_code_lines.setter
+    def _routine_source_code_lines(self, lines: List[str]) -> None:
+        """
+        Sets the source code as an array of lines string of the stored routine.
+
+        :param list[str] lines: The lines of the source code.
+        """
+        self.__routine_source_code_lines = lines
+
     # ------------------------------------------------------------------------------------------------------------------
     def load_stored_routine(self) -> Union[Dict[str, str], bool]:
         """
@@ -159,44 +269,78 @@ class RoutineLoaderHelper(metaclass=abc.ABCMeta):
 
         :rtype: dict[str,str]|bool
         """
-        try:
-            self._routine_name = os.path.splitext(os.path.basename(self._source_filename))[0]
+        self.plan()
 
-            if os.path.exists(self._source_filename):
-                if os.path.isfile(self._source_filename):
-                    self._m_time = int(os.path.getmtime(self._source_filename))
-                else:
-                    raise LoaderException("Unable to get mtime of file '{}'".format(self._source_filename))
-            else:
-                raise LoaderException("Source file '{}' does not exist".format(self._source_filename))
+        return self.execute()
 
+    # ------------------------------------------------------------------------------------------------------------------
+    def plan(self) -> bool:
+        """
+        Determines whether the stored routine must be (re)loaded. Returns True if the stored routine must be
+        (re)loaded, i.e. execute must read the source file. Otherwise returns False.
+
+        :rtype: bool
+        """
+        basename = os.path.basename(self._source_filename)
+        self._routine_name = basename.rpartition('.')[0] or basename
+        self.__load = None
+
+        st = self.__stat_source_file()
+        if st is None:
+            self._io.error("Source file '{}' does not exist".format(self._source_filename))
+            return False
+
+        if not stat.S_ISREG(st.st_mode):
+            self._io.error("Unable to get mtime of file '{}'".format(self._source_filename))
+            return False
+
+        self._m_time = int(st.st_mtime)
+
+        try:
             if self._pystratum_old_metadata:
                 self._pystratum_metadata = self._pystratum_old_metadata
 
-            load = self._must_reload()
-            if load:
-                self.__read_source_file()
+            self.__load = self.__source_changed() or self._must_reload()
+        except Exception as exception:
+            self._log_exception(exception)
+            return False
+
+        return self.__load
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def execute(self) -> Union[Dict[str, str], bool]:
+        """
+        (Re)loads the stored routine if required as determined by plan.
 
-                self.__get_placeholders()
+        Returns the metadata of the stored routine if the stored routine is up to date or loaded successfully.
+        Otherwise returns False.
 
-                self._get_designation_type()
+        :rtype: dict[str,str]|bool
+        """
+        if self.__load is None:
+            return False
+
+        if not self.__load:
+            # The stored routine is up to date: the source file has not been (and will not be) read.
+            return self._pystratum_metadata
 
-                self._get_name()
+        try:
+            self.__reload_from_disk()
 
-                self.__substitute_replace_pairs()
+            self.__substitute_replace_pairs()
 
-                self._load_routine_file()
+            self._load_routine_file()
 
-                if self._designation_type == 'bulk_insert':
-                    self._get_bulk_insert_table_columns_info()
+            if self._designation_type == 'bulk_insert':
+                self._get_bulk_insert_table_columns_info()
 
-                self._get_routine_parameters_info()
+            self._get_routine_parameters_info()
 
-                self.__get_doc_block_parts_wrapper()
+            self.__get_doc_block_parts_wrapper()
 
-                self.__save_shadow_copy()
+            self.__save_shadow_copy()
 
-                self._update_metadata()
+            self._update_metadata()
 
             return self._pystratum_metadata
 
@@ -204,15 +348,82 @@ class RoutineLoaderHelper(metaclass=abc.ABCMeta):
             self._log_exception(exception)
             return False
 
+    # ------------------------------------------------------------------------------------------------------------------
+    def __reload_from_disk(self) -> None:
+        """
+        Reads the source file of the stored routine (unless prefetched) and extracts the placeholders, the
+        designation type, and the name of the stored routine.
+
+        Only invoked when the stored routine must be (re)loaded.
+        """
+        if self._routine_source_code is None:
+            self.__read_source_file()
+
+        self.__get_placeholders()
+
+        self._get_designation_type()
+
+        self._get_name()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def prefetch_sources(helpers: List['RoutineLoaderHelper']) -> None:
+        """
+        Reads concurrently the source files of stored routines, such that execute does not need to read these files.
+        Intended for the helpers for which plan returned True.
+
+        :param list[RoutineLoaderHelper] helpers: The routine loader helpers.
+        """
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for _ in executor.map(RoutineLoaderHelper._read_source_only, helpers):
+                pass
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _read_source_only(self) -> None:
+        """
+        Reads the source file (if not read already). Errors are ignored here, they are reported by execute.
+        """
+        if self._routine_source_code is None:
+            try:
+                self.__read_source_file()
+            except Exception:
+                pass
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __stat_source_file(self) -> Optional[os.stat_result]:
+        """
+        Returns the status of the source file. Returns None if the source file does not exist (or is not accessible).
+        The source file is stat-ed only once.
+
+        :rtype: os.stat_result|None
+        """
+        if self.__source_stat is None:
+            try:
+                self.__source_stat = os.stat(self._source_filename)
+            except OSError:
+                return None
+
+        return self.__source_stat
+
     # ------------------------------------------------------------------------------------------------------------------
     def __read_source_file(self) -> None:
         """
         Reads the file with the source of the stored routine.
         """
-        with open(self._source_filename, 'r', encoding=self._routine_file_encoding) as file:
-            self._routine_source_code = file.read()
+        with open(self._source_filename, 'rb') as file:
+            raw = file.read()
+        source = raw.decode(self._routine_file_encoding)
 
-        self._routine_source_code_lines = self._routine_source_code.split("\n")
+        if codecs.lookup(self._routine_file_encoding).name in _ASCII_COMPATIBLE_ENCODINGS:
+            self.__routine_source_code_bytes = raw
+
+        # Translate newlines like reading in text mode.
+        if '\r' in source:
+            source = source.replace('\r\n', '\n').replace('\r', '\n')
+
+        self._routine_source_code = source
+        self.__routine_source_code_lines = None
 
     # ------------------------------------------------------------------------------------------------------------------
     def __save_shadow_copy(self) -> None:
@@ -224,19 +435,21 @@ class RoutineLoaderHelper(metaclass=abc.ABCMeta):
 
         destination_filename = os.path.join(self.shadow_directory, self._routine_name) + '.sql'
 
-        if os.path.realpath(destination_filename) == os.path.realpath(self._source_filename):
+        if os.path.realpath(destination_filename) == self.__get_real_path():
             raise LoaderException("Shadow copy will override routine source '{}'".format(self._source_filename))
 
         # Remove the (read only) shadow file if it exists.
-        if os.path.exists(destination_filename):
+        try:
             os.remove(destination_filename)
+        except FileNotFoundError:
+            pass
 
         # Write the shadow file.
         with open(destination_filename, 'wt', encoding=self._routine_file_encoding) as handle:
             handle.write(self._routine_source_code)
 
         # Make the file read only.
-        mode = os.stat(self._source_filename)[stat.ST_MODE]
+        mode = self.__stat_source_file().st_mode
         os.chmod(destination_filename, mode & ~stat.S_IWUSR & ~stat.S_IWGRP & ~stat.S_IWOTH)
 
     # ------------------------------------------------------------------------------------------------------------------
@@ -246,18 +459,25 @@ class RoutineLoaderHelper(metaclass=abc.ABCMeta):
         """
         self._set_magic_constants()
 
-        routine_source = []
-        i = 0
-        for line in self._routine_source_code_lines:
-            self._replace['__LINE__'] = "'%d'" % (i + 1)
-            for search, replace in self._replace.items():
-                tmp = re.findall(search, line, re.IGNORECASE)
-                if tmp:
-                    line = line.replace(tmp[0], replace)
-            routine_source.append(line)
-            i += 1
+        source = self._routine_source_code
+        replace = {search.lower(): value for search, value in self._replace.items() if search != '__LINE__'}
+        pattern = re.compile('|'.join([re.escape(search) for search in sorted(replace, key=len, reverse=True)] +
+                                      ['__line__']),
+                             re.IGNORECASE)
+        line_starts = []
+
+        def substitute(match) -> str:
+            search = match.group(0).lower()
+            if search == '__line__':
+                if not line_starts:
+                    line_starts.append(0)
+                    line_starts.extend([newline.end() for newline in _NEWLINE_RE.finditer(source)])
+                return "'%d'" % bisect.bisect_right(line_starts, match.start())
+
+            return replace[search]
 
-        self._routine_source_code = "\n".join(routine_source)
+        self._routine_source_code = pattern.sub(substitute, source)
+        self._replace['__LINE__'] = "'%d'" % (source.count("\n") + 1)
 
     # ------------------------------------------------------------------------------------------------------------------
     def _log_exception(self, exception: Exception) -> None:
@@ -270,38 +490,106 @@ class RoutineLoaderHelper(metaclass=abc.ABCMeta):
         """
         self._io.error(str(exception).strip().split(os.linesep))
 
+    # ------------------------------------------------------------------------------------------------------------------
+    def __source_changed(self) -> bool:
+        """
+        Returns True if the stored routine must be loaded regardless of RDBMS specific reasons, i.e. the stored routine
+        is new, its source file has been modified, or the stored routine does not exist in the RDBMS instance.
+        Otherwise returns False.
+
+        :rtype: bool
+        """
+        if not self._pystratum_old_metadata or not self._rdbms_old_metadata:
+            return True
+
+        return self._pystratum_old_metadata.get('timestamp') != self._m_time
+
     # ------------------------------------------------------------------------------------------------------------------
     @abc.abstractmethod
     def _must_reload(self) -> bool:
         """
         Returns True if the source file must be load or reloaded. Otherwise returns False.
 
+        This method is called before the source file is read. Use _peek_source_head when (a part of) the source is
+        required to decide, and _replace_pairs_changed to check the values of the placeholders.
+
         :rtype: bool
         """
         raise NotImplementedError()
 
     # ------------------------------------------------------------------------------------------------------------------
-    def __get_placeholders(self) -> None:
+    def _replace_pairs_changed(self) -> bool:
         """
-        Extracts the placeholders from the stored routine source.
+        Returns True if the value of one or more placeholders found in the source of the stored routine when it was
+        loaded previously has been changed or removed. Otherwise returns False. Magic constants (e.g. __LINE__) are
+        not placeholders and are ignored.
+
+        Intended for implementations of _must_reload, e.g.:
+
+            def _must_reload(self) -> bool:
+                return self._replace_pairs_changed() or <RDBMS specific checks>
+
+        _must_reload is invoked only when the previous metadata of the stored routine exists and its modification
+        time is unchanged, hence the (cheaper) checks on the modification time need not be repeated.
+
+        :rtype: bool
         """
-        pattern = re.compile('(@[A-Za-z0-9_.]+(%(max-)?type)?@)')
-        matches = pattern.findall(self._routine_source_code)
+        old_replace = self._pystratum_old_metadata.get('replace')
+        if not old_replace:
+            return False
 
-        placeholders = []
+        old_pairs = {key.lower(): value for key, value in old_replace.items() if key not in _MAGIC_CONSTANTS}
 
-        if len(matches) != 0:
-            for tmp in matches:
-                placeholder = tmp[0]
-                if placeholder.lower() not in self._replace_pairs:
-                    raise LoaderException("Unknown placeholder '{0}' in file {1}".
-                                          format(placeholder, self._source_filename))
-                if placeholder not in placeholders:
-                    placeholders.append(placeholder)
+        return not old_pairs.items() <= self._replace_pairs.items()
 
-        for placeholder in placeholders:
-            if placeholder not in self._replace:
-                self._replace[placeholder] = self._replace_pairs[placeholder.lower()]
+    # ------------------------------------------------------------------------------------------------------------------
+    def _peek_source_head(self, nchars: int = 4096) -> str:
+        """
+        Returns the head of the source of the stored routine without reading the whole source file. The head is the
+        same whether or not the source file has been read already, i.e. newlines are translated to LF and the head
+        consists of whole characters only.
+
+        :param int nchars: The maximum number of characters (not bytes) of the head, counted after translating
+                           newlines.
+
+        :rtype: str
+        """
+        if self._routine_source_code is not None:
+            return self._routine_source_code[:nchars]
+
+        # Text mode with universal newlines translates CRLF and CR to LF like __read_source_file.
+        with open(self._source_filename, 'r', encoding=self._routine_file_encoding) as file:
+            return file.read(nchars)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __get_placeholders(self) -> None:
+        """
+        Extracts the placeholders from the stored routine source.
+        """
+        raw = self.__routine_source_code_bytes
+        if raw is not None:
+            self.__routine_source_code_bytes = None
+            matches = _PLACEHOLDER_RE_B.finditer(raw)
+        else:
+            matches = _PLACEHOLDER_RE.finditer(self._routine_source_code)
+
+        seen = set()
+        replace = self._replace
+        replace_pairs = self._replace_pairs
+        for match in matches:
+            placeholder = match.group(1)
+            if placeholder in seen:
+                continue
+            seen.add(placeholder)
+
+            if raw is not None:
+                placeholder = placeholder.decode('ascii')
+            try:
+                value = replace_pairs[placeholder.lower()]
+            except KeyError:
+                raise LoaderException("Unknown placeholder '{0}' in file {1}".
+                                      format(placeholder, self._source_filename))
+            replace.setdefault(placeholder, value)
 
     # ------------------------------------------------------------------------------------------------------------------
     def _get_designation_type(self) -> None:
@@ -310,25 +598,23 @@ class RoutineLoaderHelper(metaclass=abc.ABCMeta):
         """
         positions = self._get_specification_positions()
         if positions[0] != -1 and positions[1] != -1:
-            pattern = re.compile(r'^\s*--\s+type\s*:\s*(\w+)\s*(.+)?\s*', re.IGNORECASE)
             for line_number in range(positions[0], positions[1] + 1):
-                matches = pattern.findall(self._routine_source_code_lines[line_number])
-                if matches:
-                    self._designation_type = matches[0][0].lower()
-                    tmp = str(matches[0][1])
+                match = _DESIGNATION_RE.match(self._routine_source_code_lines[line_number])
+                if match:
+                    designation_type, tmp = match.groups('')
+                    self._designation_type = sys.intern(designation_type.lower())
                     if self._designation_type == 'bulk_insert':
-                        n = re.compile(r'([a-zA-Z0-9_]+)\s+([a-zA-Z0-9_,]+)', re.IGNORECASE)
-                        info = n.findall(tmp)
+                        info = _BULK_INSERT_RE.search(tmp)
                         if not info:
                             raise LoaderException('Expected: -- type: bulk_insert <table_name> <columns> in file {0}'.
                                                   format(self._source_filename))
-                        self._table_name = info[0][0]
-                        self._columns = str(info[0][1]).split(',')
+                        self._table_name = info.group(1)
+                        self._columns = info.group(2).split(',')
 
                     elif self._designation_type == 'rows_with_key' or self._designation_type == 'rows_with_index':
-                        self._columns = str(matches[0][1]).split(',')
+                        self._columns = tmp.split(',')
                     else:
-                        if matches[0][1]:
+                        if tmp:
                             raise LoaderException('Expected: -- type: {}'.format(self._designation_type))
 
         if not self._designation_type:
@@ -343,12 +629,10 @@ class RoutineLoaderHelper(metaclass=abc.ABCMeta):
         :rtype: tuple
         """
         start = -1
+        end = -1
         for (i, line) in enumerate(self._routine_source_code_lines):
             if self._is_start_of_stored_routine(line):
                 start = i
-
-        end = -1
-        for (i, line) in enumerate(self._routine_source_code_lines):
             if self._is_start_of_stored_routine_body(line):
                 end = i - 1
 
@@ -387,10 +671,10 @@ class RoutineLoaderHelper(metaclass=abc.ABCMeta):
 
         i = 0
         for line in self._routine_source_code_lines:
-            if re.match(r'\s*/\*\*', line):
+            if _DOC_BLOCK_START_RE.match(line):
                 line1 = i
 
-            if re.match(r'\s*\*/', line):
+            if _DOC_BLOCK_END_RE.match(line):
                 line2 = i
 
             if self._is_start_of_stored_routine(line):
@@ -414,14 +698,15 @@ class RoutineLoaderHelper(metaclass=abc.ABCMeta):
 
         reflection = DocBlockReflection(doc_block)
 
-        self._doc_block_parts_source['description'] = reflection.get_description()
-
-        self._doc_block_parts_source['parameters'] = list()
+        parameters = list()
         for tag in reflection.get_tags('param'):
-            parts = re.match(r'^(@param)\s+(\w+)\s*(.+)?', tag, re.DOTALL)
+            parts = _PARAM_TAG_RE.match(tag)
             if parts:
-                self._doc_block_parts_source['parameters'].append({'name':        parts.group(2),
-                                                                   'description': parts.group(3)})
+                parameters.append({'name':        parts.group(2),
+                                   'description': parts.group(3)})
+
+        self._doc_block_parts_source.update({'description': reflection.get_description(),
+                                             'parameters':  parameters})
 
     # ------------------------------------------------------------------------------------------------------------------
     def __get_parameter_doc_description(self, name: str) -> str:
@@ -466,8 +751,8 @@ class RoutineLoaderHelper(metaclass=abc.ABCMeta):
                      'data_type_descriptor': parameter_info['data_type_descriptor'],
                      'description':          self.__get_parameter_doc_description(parameter_info['name'])})
 
-        self._doc_block_parts_wrapper['description'] = self._doc_block_parts_source['description']
-        self._doc_block_parts_wrapper['parameters'] = parameters
+        self._doc_block_parts_wrapper.update({'description': self._doc_block_parts_source['description'],
+                                              'parameters':  parameters})
 
     # ------------------------------------------------------------------------------------------------------------------
     @abc.abstractmethod
@@ -508,16 +793,16 @@ class RoutineLoaderHelper(metaclass=abc.ABCMeta):
         """
         Updates the metadata of the stored routine.
         """
-        self._pystratum_metadata['routine_name'] = self._routine_name
-        self._pystratum_metadata['designation'] = self._designation_type
-        self._pystratum_metadata['table_name'] = self._table_name
-        self._pystratum_metadata['parameters'] = self._parameters
-        self._pystratum_metadata['columns'] = self._columns
-        self._pystratum_metadata['fields'] = self._fields
-        self._pystratum_metadata['column_types'] = self._columns_types
-        self._pystratum_metadata['timestamp'] = self._m_time
-        self._pystratum_metadata['replace'] = self._replace
-        self._pystratum_metadata['pydoc'] = self._doc_block_parts_wrapper
+        self._pystratum_metadata.update({'routine_name': self._routine_name,
+                                         'designation':  self._designation_type,
+                                         'table_name':   self._table_name,
+                                         'parameters':   self._parameters,
+                                         'columns':      self._columns,
+                                         'fields':       self._fields,
+                                         'column_types': self._columns_types,
+                                         'timestamp':    self._m_time,
+                                         'replace':      self._replace,
+                                         'pydoc':        self._doc_block_parts_wrapper})
 
     # ------------------------------------------------------------------------------------------------------------------
     @abc.abstractmethod
@@ -532,28 +817,32 @@ class RoutineLoaderHelper(metaclass=abc.ABCMeta):
         """
         Adds magic constants to replace list.
         """
-        real_path = os.path.realpath(self._source_filename)
+        real_path = self.__get_real_path()
 
-        self._replace['__FILE__'] = "'%s'" % real_path
-        self._replace['__ROUTINE__'] = "'%s'" % self._routine_name
-        self._replace['__DIR__'] = "'%s'" % os.path.dirname(real_path)
+        self._replace.update({'__FILE__':    "'%s'" % real_path,
+                              '__ROUTINE__': "'%s'" % self._routine_name,
+                              '__DIR__':     "'%s'" % os.path.dirname(real_path)})
 
     # ------------------------------------------------------------------------------------------------------------------
-    def _unset_magic_constants(self) -> None:
-        """
-        Removes magic constants from current replace list.
+    def __get_real_path(self) -> str:
         """
-        if '__FILE__' in self._replace:
-            del self._replace['__FILE__']
+        Returns the canonical path of the source file. The path is resolved only once.
 
-        if '__ROUTINE__' in self._replace:
-            del self._replace['__ROUTINE__']
+        :rtype: str
+        """
+        if self.__real_path is None:
+            self.__real_path = os.path.realpath(self._source_filename)
 
-        if '__DIR__' in self._replace:
-            del self._replace['__DIR__']
+        return self.__real_path
 
-        if '__LINE__' in self._replace:
-            del self._replace['__LINE__']
+    # ------------------------------------------------------------------------------------------------------------------
+    def _unset_magic_constants(self) -> None:
+        """
+        Removes magic constants from current replace list.
+        """
+        replace = self._replace
+        for name in _MAGIC_CONSTANTS:
+            replace.pop(name, None)
 
     # ------------------------------------------------------------------------------------------------------------------
     def _print_sql_with_error(self, sql: str, error_line: int) -> None:
@@ -2,13 +2,13 @@
 PyStratum
 """
 import abc
-import configparser
 import json
 import os
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
 from pystratum.style.PyStratumStyle import PyStratumStyle
 
+from pystratum.ConfigCache import ConfigCache
 from pystratum.Util import Util
 
 
@@ -24,7 +24,7 @@ class RoutineWrapperGenerator:
 
         :param PyStratumStyle io: The output decorator.
         """
-        self._code: str = ''
+        self._code_parts: List[str] = []
         """
         The generated Python code buffer.
         """
@@ -64,6 +64,36 @@ class RoutineWrapperGenerator:
         The output decorator.
         """
 
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def _code(self) -> str:
+        """
+        The generated Python code.
+
+        :rtype: str
+        """
+        return ''.join(self._code_parts)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @_code.setter
+    def _code(self, code: str) -> None:
+        """
+        Replaces the generated Python code. Kept for subclasses that append code with self._code += ..., prefer
+        _write for appending code.
+
+        :param str code: The generated Python code.
+        """
+        self._code_parts = [code]
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _write(self, code: str) -> None:
+        """
+        Appends a part of Python code to the generated code buffer.
+
+        :param str code: The part of Python code.
+        """
+        self._code_parts.append(code)
+
     # ------------------------------------------------------------------------------------------------------------------
     def main(self, config_filename: str) -> int:
         """
@@ -111,15 +141,14 @@ class RoutineWrapperGenerator:
 
         :param str config_filename: The name of the configuration file.
         """
-        config = configparser.ConfigParser()
-        config.read(config_filename)
+        config = ConfigCache.get(config_filename)
 
-        self._parent_class_name = config.get('wrapper', 'parent_class')
-        self._parent_class_namespace = config.get('wrapper', 'parent_class_namespace')
-        self._wrapper_class_name = config.get('wrapper', 'wrapper_class')
-        self._wrapper_filename = config.get('wrapper', 'wrapper_file')
-        self._metadata_filename = config.get('wrapper', 'metadata')
-        self._lob_as_string_flag = config.get('wrapper', 'lob_as_string')
+        self._parent_class_name = config['wrapper']['parent_class']
+        self._parent_class_namespace = config['wrapper']['parent_class_namespace']
+        self._wrapper_class_name = config['wrapper']['wrapper_class']
+        self._wrapper_filename = config['wrapper']['wrapper_file']
+        self._metadata_filename = config['wrapper']['metadata']
+        self._lob_as_string_flag = config['wrapper']['lob_as_string']
 
     # ------------------------------------------------------------------------------------------------------------------
     def _read_routine_metadata(self) -> Dict:
@@ -159,9 +188,8 @@ class RoutineWrapperGenerator:
         :param str text: The line with Python code.
         """
         if text:
-            self._code += str(text) + "\n"
-        else:
-            self._code += "\n"
+            self._code_parts.append(str(text))
+        self._code_parts.append("\n")
 
     # ------------------------------------------------------------------------------------------------------------------
     def _write_class_trailer(self) -> None:
@@ -176,7 +204,8 @@ class RoutineWrapperGenerator:
     @abc.abstractmethod
     def _write_routine_function(self, routine: Dict[str, Any]) -> None:
         """
-        Generates a complete wrapper method for a stored routine.
+        Generates a complete wrapper method for a stored routine and appends it to the generated code buffer,
+        preferably with _write.
 
         :param dict routine: The metadata of the stored routine.
         """
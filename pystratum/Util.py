@@ -28,12 +28,11 @@ class Util:
         :param str data: The data that must be written.
         :param  PyStratumStyle io: The output decorator.
         """
-        write_flag = True
-        if os.path.exists(filename):
+        try:
             with open(filename, 'r') as file:
-                old_data = file.read()
-                if data == old_data:
-                    write_flag = False
+                write_flag = data != file.read()
+        except FileNotFoundError:
+            write_flag = True
 
         if write_flag:
             tmp_filename = filename + '.tmp'
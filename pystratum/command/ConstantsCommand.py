@@ -1,15 +1,23 @@
 """
 PyStratum
 """
-import configparser
-from pydoc import locate
+import importlib
 
 from cleo import Command, Input, Output
+from pystratum.ConfigCache import ConfigCache
 from pystratum.Constants import Constants
 
 from pystratum.style.PyStratumStyle import PyStratumStyle
 
 
+_CONSTANTS = {'mysql': ('pystratum_mysql.MySqlConstants', 'MySqlConstants'),
+              'mssql': ('pystratum_mssql.MsSqlConstants', 'MsSqlConstants'),
+              'pgsql': ('pystratum_pgsql.PgSqlConstants', 'PgSqlConstants')}
+"""
+Map from RDBMS to the module and class name of the constants for that RDBMS.
+"""
+
+
 class ConstantsCommand(Command):
     """
     Generates constants based on database IDs
@@ -44,12 +52,10 @@ class ConstantsCommand(Command):
         """
         :param str config_file: The name of config file.
         """
-        config = configparser.ConfigParser()
-
-        config.read(config_file)
+        config = ConfigCache.get(config_file)
 
-        rdbms = config.get('database', 'rdbms').lower()
-        label_regex = config.get('constants', 'label_regex')
+        rdbms = config['database']['rdbms'].lower()
+        label_regex = config['constants']['label_regex']
 
         constants = self.create_constants(rdbms)
         constants.main(config_file, label_regex)
@@ -70,18 +76,12 @@ class ConstantsCommand(Command):
         #       and other dependencies for the targeted RDBMS must be installed (and required modules and other
         #       dependencies for the other RDBMSs are not required).
 
-        if rdbms == 'mysql':
-            module = locate('pystratum_mysql.MySqlConstants')
-            return module.MySqlConstants(self.output)
-
-        if rdbms == 'mssql':
-            module = locate('pystratum_mssql.MsSqlConstants')
-            return module.MsSqlConstants(self.output)
+        if rdbms not in _CONSTANTS:
+            raise Exception("Unknown RDBMS '{0!s}'.".format(rdbms))
 
-        if rdbms == 'pgsql':
-            module = locate('pystratum_pgsql.PgSqlConstants')
-            return module.PgSqlConstants(self.output)
+        module_name, class_name = _CONSTANTS[rdbms]
+        module = importlib.import_module(module_name)
 
-        raise Exception("Unknown RDBMS '{0!s}'.".format(rdbms))
+        return getattr(module, class_name)(self.output)
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -1,15 +1,23 @@
 """
 PyStratum
 """
-import configparser
-from pydoc import locate
+import importlib
 
 from cleo import Command, Input, Output
+from pystratum.ConfigCache import ConfigCache
 from pystratum.RoutineLoader import RoutineLoader
 
 from pystratum.style.PyStratumStyle import PyStratumStyle
 
 
+_LOADERS = {'mysql': ('pystratum_mysql.MySqlRoutineLoader', 'MySqlRoutineLoader'),
+            'mssql': ('pystratum_mssql.MsSqlRoutineLoader', 'MsSqlRoutineLoader'),
+            'pgsql': ('pystratum_pgsql.PgSqlRoutineLoader', 'PgSqlRoutineLoader')}
+"""
+Map from RDBMS to the module and class name of the routine loader for that RDBMS.
+"""
+
+
 class LoaderCommand(Command):
     """
     Command for loading stored routines into a MySQL/MsSQL/PgSQL instance from pseudo SQL files
@@ -47,10 +55,9 @@ class LoaderCommand(Command):
         :param str config_file: The name of config file.
         :param list sources: The list with source files.
         """
-        config = configparser.ConfigParser()
-        config.read(config_file)
+        config = ConfigCache.get(config_file)
 
-        rdbms = config.get('database', 'rdbms').lower()
+        rdbms = config['database']['rdbms'].lower()
 
         loader = self.create_routine_loader(rdbms)
         status = loader.main(config_file, sources)
@@ -71,18 +78,12 @@ class LoaderCommand(Command):
         #       and other dependencies for the targeted RDBMS must be installed (and required modules and other
         #       dependencies for the other RDBMSs are not required).
 
-        if rdbms == 'mysql':
-            module = locate('pystratum_mysql.MySqlRoutineLoader')
-            return module.MySqlRoutineLoader(self.output)
-
-        if rdbms == 'mssql':
-            module = locate('pystratum_mssql.MsSqlRoutineLoader')
-            return module.MsSqlRoutineLoader(self.output)
+        if rdbms not in _LOADERS:
+            raise Exception("Unknown RDBMS '{0!s}'.".format(rdbms))
 
-        if rdbms == 'pgsql':
-            module = locate('pystratum_pgsql.PgSqlRoutineLoader')
-            return module.PgSqlRoutineLoader(self.output)
+        module_name, class_name = _LOADERS[rdbms]
+        module = importlib.import_module(module_name)
 
-        raise Exception("Unknown RDBMS '{0!s}'.".format(rdbms))
+        return getattr(module, class_name)(self.output)
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -1,15 +1,23 @@
 """
 PyStratum
 """
-import configparser
-from pydoc import locate
+import importlib
 
 from cleo import Command, Input, Output
+from pystratum.ConfigCache import ConfigCache
 from pystratum.RoutineWrapperGenerator import RoutineWrapperGenerator
 
 from pystratum.style.PyStratumStyle import PyStratumStyle
 
 
+_GENERATORS = {'mysql': ('pystratum_mysql.MySqlRoutineWrapperGenerator', 'MySqlRoutineWrapperGenerator'),
+               'mssql': ('pystratum_mssql.MsSqlRoutineWrapperGenerator', 'MsSqlRoutineWrapperGenerator'),
+               'pgsql': ('pystratum_pgsql.PgSqlRoutineWrapperGenerator', 'PgSqlRoutineWrapperGenerator')}
+"""
+Map from RDBMS to the module and class name of the routine wrapper generator for that RDBMS.
+"""
+
+
 class WrapperCommand(Command):
     """
     Command for generating a class with wrapper methods for calling stored routines in a MySQL/MsSQL/PgSQL database
@@ -44,10 +52,9 @@ class WrapperCommand(Command):
         """
         :param str config_file: The name of config file.
         """
-        config = configparser.ConfigParser()
-        config.read(config_file)
+        config = ConfigCache.get(config_file)
 
-        rdbms = config.get('database', 'rdbms').lower()
+        rdbms = config['database']['rdbms'].lower()
 
         wrapper = self.create_routine_wrapper_generator(rdbms)
         wrapper.main(config_file)
@@ -68,18 +75,12 @@ class WrapperCommand(Command):
         #       and other dependencies for the targeted RDBMS must be installed (and required modules and other
         #       dependencies for the other RDBMSs are not required).
 
-        if rdbms == 'mysql':
-            module = locate('pystratum_mysql.MySqlRoutineWrapperGenerator')
-            return module.MySqlRoutineWrapperGenerator(self.output)
-
-        if rdbms == 'mssql':
-            module = locate('pystratum_mssql.MsSqlRoutineWrapperGenerator')
-            return module.MsSqlRoutineWrapperGenerator(self.output)
+        if rdbms not in _GENERATORS:
+            raise Exception("Unknown RDBMS '{0!s}'.".format(rdbms))
 
-        if rdbms == 'pgsql':
-            module = locate('pystratum_pgsql.PgSqlRoutineWrapperGenerator')
-            return module.PgSqlRoutineWrapperGenerator(self.output)
+        module_name, class_name = _GENERATORS[rdbms]
+        module = importlib.import_module(module_name)
 
-        raise Exception("Unknown RDBMS '{0!s}'.".format(rdbms))
+        return getattr(module, class_name)(self.output)
 
 # ----------------------------------------------------------------------------------------------------------------------
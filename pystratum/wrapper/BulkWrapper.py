@@ -10,6 +10,7 @@ class BulkWrapper(Wrapper):
     """
     Wrapper method generator for stored procedures with designation type bulk.
     """
+    __slots__ = ()
 
     # ------------------------------------------------------------------------------------------------------------------
     def _return_type_hint(self) -> str:
@@ -8,6 +8,7 @@ class FunctionsWrapper(Wrapper):
     """
     Wrapper method generator for stored functions.
     """
+    __slots__ = ()
 
     # ------------------------------------------------------------------------------------------------------------------
     def _return_type_hint(self) -> str:
@@ -8,6 +8,7 @@ class LogWrapper(Wrapper):
     """
     Wrapper method generator for stored procedures with designation type log.
     """
+    __slots__ = ()
 
     # ------------------------------------------------------------------------------------------------------------------
     def _return_type_hint(self) -> str:
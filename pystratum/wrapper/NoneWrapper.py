@@ -8,6 +8,7 @@ class NoneWrapper(Wrapper):
     """
     Wrapper method generator for stored procedures without any result set.
     """
+    __slots__ = ()
 
     # ------------------------------------------------------------------------------------------------------------------
     def _return_type_hint(self) -> str:
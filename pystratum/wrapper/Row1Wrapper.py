@@ -8,6 +8,7 @@ class Row1Wrapper(Wrapper):
     """
     Wrapper method generator for stored procedures that are selecting 1 row.
     """
+    __slots__ = ()
 
     # ------------------------------------------------------------------------------------------------------------------
     def _return_type_hint(self) -> str:
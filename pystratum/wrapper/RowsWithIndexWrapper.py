@@ -12,6 +12,7 @@ class RowsWithIndexWrapper(Wrapper):
     Parent class wrapper wrapper method generator for stored procedures whose result set  must be returned using tree
     structure using a combination of non-unique columns.
     """
+    __slots__ = ()
 
     # ------------------------------------------------------------------------------------------------------------------
     def _return_type_hint(self) -> str:
@@ -8,6 +8,7 @@ class RowsWrapper(Wrapper):
     """
     Wrapper method generator for stored procedures that are selecting 0, 1, or more rows.
     """
+    __slots__ = ()
 
     # ------------------------------------------------------------------------------------------------------------------
     def _return_type_hint(self) -> str:
@@ -8,6 +8,7 @@ class Singleton1Wrapper(Wrapper):
     """
     Wrapper method generator for stored procedures that are selecting 1 row with one column only.
     """
+    __slots__ = ()
 
     # ------------------------------------------------------------------------------------------------------------------
     def _return_type_hint(self) -> str:
@@ -8,6 +8,7 @@ class TableWrapper(Wrapper):
     """
     Wrapper method generator for printing the result set of stored procedures in a table format.
     """
+    __slots__ = ()
 
     # ------------------------------------------------------------------------------------------------------------------
     def _return_type_hint(self) -> str:
@@ -3,13 +3,27 @@ PyStratum
 """
 import abc
 import os
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
+
+_SEPARATORS: Dict[Tuple[int, int], str] = {}
+"""
+Cache for horizontal (commented) lines keyed by page width and indent level.
+"""
+
+_INDENTS: Dict[int, str] = {}
+"""
+Cache for leading whitespace keyed by indent level.
+"""
 
 
 class Wrapper(metaclass=abc.ABCMeta):
     """
     Parent class for classes that generate Python code, i.e. wrappers, for calling a stored procedures and functions.
     """
+    __slots__ = ('__indent_level', '_code_parts', '_lob_as_string_flag', '_page_width', '_routine')
+    """
+    The attributes of a wrapper. Subclasses that add attributes should declare their own __slots__.
+    """
 
     # ------------------------------------------------------------------------------------------------------------------
     def __init__(self, routine: Dict[str, Any], lob_as_string_flag: bool):
@@ -24,7 +38,7 @@ class Wrapper(metaclass=abc.ABCMeta):
         The maximum number of columns in the source code.
         """
 
-        self._code: str = ''
+        self._code_parts: List[str] = []
         """
         Buffer for the generated code.
         """
@@ -44,6 +58,26 @@ class Wrapper(metaclass=abc.ABCMeta):
         If True BLOBs and CLOBs must be treated as strings.
         """
 
+    # ------------------------------------------------------------------------------------------------------------------
+    @property
+    def _code(self) -> str:
+        """
+        The generated code.
+
+        :rtype: str
+        """
+        return ''.join(self._code_parts)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    @_code.setter
+    def _code(self, code: str) -> None:
+        """
+        Replaces the generated code.
+
+        :param str code: The generated code.
+        """
+        self._code_parts = [code]
+
     # ------------------------------------------------------------------------------------------------------------------
     def _write(self, text: str) -> None:
         """
@@ -51,7 +85,7 @@ class Wrapper(metaclass=abc.ABCMeta):
 
         :param str text: The part of code that must be appended.
         """
-        self._code += str(text)
+        self._code_parts.append(text if isinstance(text, str) else str(text))
 
     # ------------------------------------------------------------------------------------------------------------------
     def _write_line(self, line: Optional[str] = None) -> None:
@@ -67,10 +101,12 @@ class Wrapper(metaclass=abc.ABCMeta):
         elif line == '':
             self._write("\n")
         else:
-            line = (' ' * 4 * self.__indent_level) + line
-            if line[-1:] == ':':
+            indent = _INDENTS.get(self.__indent_level)
+            if indent is None:
+                indent = _INDENTS[self.__indent_level] = ' ' * 4 * self.__indent_level
+            if line.endswith(':'):
                 self.__indent_level += 1
-            self._write(line + "\n")
+            self._write(indent + line + "\n")
 
     # ------------------------------------------------------------------------------------------------------------------
     def _indent_level_down(self, levels: int = 1) -> None:
@@ -79,15 +115,19 @@ class Wrapper(metaclass=abc.ABCMeta):
 
         :param levels: The number of levels indent level of the generated code must be decremented.
         """
-        self.__indent_level -= int(levels)
+        self.__indent_level -= levels
 
     # ------------------------------------------------------------------------------------------------------------------
     def _write_separator(self) -> None:
         """
         Inserts a horizontal (commented) line tot the generated code.
         """
-        tmp = self._page_width - ((4 * self.__indent_level) + 2)
-        self._write_line('# ' + ('-' * tmp))
+        key = (self._page_width, self.__indent_level)
+        separator = _SEPARATORS.get(key)
+        if separator is None:
+            tmp = self._page_width - ((4 * self.__indent_level) + 2)
+            separator = _SEPARATORS[key] = '# ' + ('-' * tmp)
+        self._write_line(separator)
 
     # ------------------------------------------------------------------------------------------------------------------
     def is_lob_parameter(self, parameters: Dict[str, Any]) -> bool:
@@ -232,17 +272,14 @@ class Wrapper(metaclass=abc.ABCMeta):
 
         :rtype: str
         """
-        ret = ''
+        args = []
 
         for parameter_info in routine['pydoc']['parameters']:
-            if ret:
-                ret += ', '
-
-            ret += parameter_info['parameter_name']
-
             if parameter_info['python_type_hint']:
-                ret += ': ' + parameter_info['python_type_hint']
+                args.append(parameter_info['parameter_name'] + ': ' + parameter_info['python_type_hint'])
+            else:
+                args.append(parameter_info['parameter_name'])
 
-        return ret
+        return ', '.join(args)
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,66 @@
+"""
+PyStratum
+"""
+import configparser
+import os
+import tempfile
+import unittest
+
+from pystratum.ConfigCache import ConfigCache
+
+
+class ConfigCacheTest(unittest.TestCase):
+    """
+    Unit test for class ConfigCache.
+    """
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test01(self):
+        """
+        Test a configuration file is parsed only once until it is modified.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'stratum.cfg')
+            with open(filename, 'w') as file:
+                file.write("[database]\nrdbms = mysql\n")
+            os.utime(filename, ns=(1000000000, 1000000000))
+
+            config1 = ConfigCache.get(filename)
+            config2 = ConfigCache.get(filename)
+            self.assertIs(config1, config2)
+            self.assertEqual('mysql', config1['database']['rdbms'])
+
+            with self.assertRaises(TypeError):
+                config1['database']['rdbms'] = 'pgsql'
+
+            with open(filename, 'w') as file:
+                file.write("[database]\nrdbms = pgsql\n")
+            os.utime(filename, ns=(2000000000, 2000000000))
+
+            config3 = ConfigCache.get(filename)
+            self.assertEqual('pgsql', config3['database']['rdbms'])
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test02(self):
+        """
+        Test a missing section or option raises the same exception as configparser.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'stratum.cfg')
+            with open(filename, 'w') as file:
+                file.write("[constants]\ncolumns = etc/columns.txt\n")
+
+            config = ConfigCache.get(filename)
+
+        self.assertIn('columns', config['constants'])
+        self.assertNotIn('prefix', config['constants'])
+        self.assertIsNone(config['constants'].get('prefix'))
+        self.assertIsNone(config.get('loader'))
+
+        with self.assertRaisesRegex(configparser.NoOptionError, "No option 'prefix' in section: 'constants'"):
+            config['constants']['prefix']
+
+        with self.assertRaisesRegex(configparser.NoSectionError, "No section: 'loader'"):
+            config['loader']
+
+# ----------------------------------------------------------------------------------------------------------------------
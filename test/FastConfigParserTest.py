@@ -0,0 +1,94 @@
+"""
+PyStratum
+"""
+import configparser
+import os
+import tempfile
+import unittest
+
+from pystratum.FastConfigParser import FastConfigParser
+
+
+class FastConfigParserTest(unittest.TestCase):
+    """
+    Unit test for class FastConfigParser.
+    """
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test01(self):
+        """
+        Test simple INI file with comments, both delimiters, and an empty value.
+        """
+        text = ['# Comment',
+                '[database]',
+                'rdbms = MySQL',
+                '',
+                '; Another comment',
+                '[constants]',
+                'Columns: etc/columns.txt',
+                'prefix =']
+        config = FastConfigParser.parse("\n".join(text))
+
+        self.assertEqual({'database':  {'rdbms': 'MySQL'},
+                          'constants': {'columns': 'etc/columns.txt', 'prefix': ''}}, config)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test02(self):
+        """
+        Test INI files that are not simple are rejected by the lightweight parser.
+        """
+        texts = ['key = value',
+                 '[a]\nkey = value\n  continued',
+                 '[a]\nkey = 100%',
+                 '[a]\nkey = 1\nkey = 2',
+                 '[a]\n[a]',
+                 '[DEFAULT]\nkey = value',
+                 '[a]\nno delimiter']
+        for text in texts:
+            with self.assertRaises(ValueError):
+                FastConfigParser.parse(text)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test03(self):
+        """
+        Test fallback to configparser for multiline values and interpolation.
+        """
+        text = ['[wrapper]',
+                'parent_class = Foo',
+                'parent_class_namespace = my.%(parent_class)s',
+                'description = Hello',
+                '  World']
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'stratum.cfg')
+            with open(filename, 'w') as file:
+                file.write("\n".join(text))
+
+            config = FastConfigParser.load(filename)
+
+        self.assertEqual({'wrapper': {'parent_class':           'Foo',
+                                      'parent_class_namespace': 'my.Foo',
+                                      'description':            'Hello\nWorld'}}, config)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test04(self):
+        """
+        Test values parsed with configparser are interpolated only when read.
+        """
+        text = ['[database]',
+                'rdbms = mysql',
+                '',
+                '[notes]',
+                'maintenance = 100% done']
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'stratum.cfg')
+            with open(filename, 'w') as file:
+                file.write("\n".join(text))
+
+            config = FastConfigParser.load(filename)
+
+        self.assertEqual('mysql', config['database']['rdbms'])
+        self.assertIn('maintenance', config['notes'])
+        with self.assertRaises(configparser.InterpolationSyntaxError):
+            config['notes']['maintenance']
+
+# ----------------------------------------------------------------------------------------------------------------------
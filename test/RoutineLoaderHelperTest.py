@@ -0,0 +1,254 @@
+"""
+PyStratum
+"""
+import os
+import tempfile
+import unittest
+from typing import Any, Dict
+
+from cleo.inputs import ListInput
+from cleo.outputs import BufferedOutput
+
+from pystratum.RoutineLoaderHelper import RoutineLoaderHelper
+from pystratum.helper.DataTypeHelper import DataTypeHelper
+from pystratum.style.PyStratumStyle import PyStratumStyle
+
+
+class TestDataTypeHelper(DataTypeHelper):
+    """
+    Data type helper mapping all data types to int.
+    """
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def column_type_to_python_type(self, data_type_info: Dict[str, Any]) -> str:
+        return 'int'
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def column_type_to_python_type_hint(self, data_type_info: Dict[str, Any]) -> str:
+        return 'int'
+
+
+class TestRoutineLoaderHelper(RoutineLoaderHelper):
+    """
+    Minimal concrete routine loader helper that records the routine source instead of loading it into a RDBMS.
+    """
+    __slots__ = ('loaded_sources',)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def __init__(self, *args):
+        RoutineLoaderHelper.__init__(self, *args)
+
+        self.loaded_sources = []
+        """
+        The sources of the stored routine as passed to the RDBMS.
+        """
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _must_reload(self) -> bool:
+        return False
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _is_start_of_stored_routine(self, line: str) -> bool:
+        return line.startswith('create procedure')
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _is_start_of_stored_routine_body(self, line: str) -> bool:
+        return line == 'begin'
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _get_data_type_helper(self) -> DataTypeHelper:
+        return TestDataTypeHelper()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _get_name(self) -> None:
+        self._routine_type = 'procedure'
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _load_routine_file(self) -> None:
+        self.loaded_sources.append(self._routine_source_code)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _get_bulk_insert_table_columns_info(self) -> None:
+        pass
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _get_routine_parameters_info(self) -> None:
+        self._parameters = []
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def _drop_routine(self) -> None:
+        pass
+
+
+class RoutineLoaderHelperTest(unittest.TestCase):
+    """
+    Unit test for class RoutineLoaderHelper.
+    """
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.output = BufferedOutput()
+        self.io = PyStratumStyle(ListInput([]), self.output)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def tearDown(self):
+        self.directory.cleanup()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def create_helper(self, source: str, replace_pairs: Dict[str, str], old_metadata=None, rdbms_old_metadata=None):
+        """
+        Writes the source of a stored routine and returns a routine loader helper for it.
+
+        :param str source: The source of the stored routine.
+        :param dict[str,str] replace_pairs: The replace pairs.
+        :param dict|None old_metadata: The metadata of the stored routine from PyStratum.
+        :param dict|None rdbms_old_metadata: The metadata of the stored routine from the RDBMS.
+
+        :rtype: TestRoutineLoaderHelper
+        """
+        filename = os.path.join(self.directory.name, 'tst_test.psql')
+        with open(filename, 'w', newline='') as file:
+            file.write(source)
+
+        return TestRoutineLoaderHelper(filename, 'utf-8', old_metadata, replace_pairs, rdbms_old_metadata, self.io)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test01(self):
+        """
+        Test execute returns the old metadata without reading the source file when plan returns False.
+        """
+        helper = self.create_helper('create procedure tst_test()\n-- type: none\nbegin\nend\n', {})
+        metadata = helper.load_stored_routine()
+        self.assertTrue(metadata)
+
+        helper = TestRoutineLoaderHelper(helper._source_filename, 'utf-8', metadata.copy(), {}, {'tst_test': {}},
+                                         self.io)
+        self.assertFalse(helper.plan())
+
+        os.remove(helper._source_filename)
+        self.assertEqual(metadata, helper.execute())
+        self.assertEqual([], helper.loaded_sources)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test02(self):
+        """
+        Test execute returns False when plan failed.
+        """
+        filename = os.path.join(self.directory.name, 'tst_missing.psql')
+        helper = TestRoutineLoaderHelper(filename, 'utf-8', None, {}, None, self.io)
+
+        self.assertFalse(helper.plan())
+        self.assertIs(False, helper.execute())
+        self.assertEqual([], helper.loaded_sources)
+        self.assertIn('does not exist', self.output.fetch())
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test03(self):
+        """
+        Test substitution of __LINE__ on the first, a middle, and the last line, and of overlapping and mixed case
+        placeholders.
+        """
+        source = ['create procedure tst_test() -- __LINE__',
+                  '-- type: none',
+                  'begin',
+                  '  select __line__, @a@, @ab@, @AB@, @Ab@a, __ROUTINE__;',
+                  'end -- __LINE__']
+        helper = self.create_helper("\n".join(source), {'@a@': '1', '@ab@': '12'})
+        metadata = helper.load_stored_routine()
+        self.assertTrue(metadata, self.output.fetch())
+
+        expected = ["create procedure tst_test() -- '1'",
+                    '-- type: none',
+                    'begin',
+                    "  select '4', 1, 12, 12, 12a, 'tst_test';",
+                    "end -- '5'"]
+        self.assertEqual(["\n".join(expected)], helper.loaded_sources)
+        self.assertEqual("'5'", metadata['replace']['__LINE__'])
+        self.assertEqual({'@a@', '@ab@', '@AB@', '@Ab@'}, {key for key in metadata['replace'] if key[0] == '@'})
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test04(self):
+        """
+        Test substitution in a source without __LINE__.
+        """
+        source = ['create procedure tst_test()',
+                  '-- type: none',
+                  'begin',
+                  '  select @a@;',
+                  'end',
+                  '']
+        helper = self.create_helper("\n".join(source), {'@a@': '1'})
+        metadata = helper.load_stored_routine()
+        self.assertTrue(metadata, self.output.fetch())
+
+        expected = ['create procedure tst_test()',
+                    '-- type: none',
+                    'begin',
+                    '  select 1;',
+                    'end',
+                    '']
+        self.assertEqual(["\n".join(expected)], helper.loaded_sources)
+        self.assertEqual("'6'", metadata['replace']['__LINE__'])
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test05(self):
+        """
+        Test detection of changed and removed values of placeholders.
+        """
+        replace_pairs = {'@a@': '1', '@b@': '2'}
+        cases = [({}, False),
+                 ({'@A@': '1'}, False),
+                 ({'@a@': '1', '@b@': '2'}, False),
+                 ({'@A@': '3'}, True),
+                 ({'@c@': '1'}, True)]
+        for old_replace, changed in cases:
+            helper = self.create_helper('', replace_pairs, {'replace': old_replace})
+            self.assertEqual(changed, helper._replace_pairs_changed(), old_replace)
+
+        source = ['create procedure tst_test() -- __ROUTINE__ in __FILE__ and __DIR__',
+                  '-- type: none',
+                  'begin',
+                  '  select @A@, __LINE__;',
+                  'end']
+        helper = self.create_helper("\n".join(source), replace_pairs)
+        metadata = helper.load_stored_routine()
+        self.assertTrue(metadata, self.output.fetch())
+        self.assertIn('__LINE__', metadata['replace'])
+
+        helper = TestRoutineLoaderHelper(helper._source_filename, 'utf-8', metadata, replace_pairs, {}, self.io)
+        self.assertFalse(helper._replace_pairs_changed())
+
+        helper = TestRoutineLoaderHelper(helper._source_filename, 'utf-8', metadata, {'@a@': '3'}, {}, self.io)
+        self.assertTrue(helper._replace_pairs_changed())
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test06(self):
+        """
+        Test an error while prefetching the source file is reported by execute only.
+        """
+        helper = self.create_helper('create procedure tst_test()\n-- type: none\nbegin\nend\n', {})
+        helper = TestRoutineLoaderHelper(helper._source_filename, 'no-such-encoding', None, {}, None, self.io)
+
+        self.assertTrue(helper.plan())
+        RoutineLoaderHelper.prefetch_sources([helper])
+        self.assertIs(False, helper.execute())
+        self.assertIn('no-such-encoding', self.output.fetch())
+
+    # ------------------------------------------------------------------------------------------------------------------
+    def test07(self):
+        """
+        Test the head of the source is the same whether or not the source file has been read already.
+        """
+        source = 'create procedure tst_test()\r\n-- type: none\r\nbegin\r\n  select \'\u00e9\u20ac\';\rend\r\n'
+        for nchars in range(len(source) + 1):
+            unread = self.create_helper(source, {})
+            head = unread._peek_source_head(nchars)
+
+            prefetched = self.create_helper(source, {})
+            prefetched._read_source_only()
+
+            self.assertEqual(prefetched._peek_source_head(nchars), head)
+            self.assertEqual(source.replace('\r\n', '\n').replace('\r', '\n')[:nchars], head)
+
+# ----------------------------------------------------------------------------------------------------------------------